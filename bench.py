@@ -0,0 +1,74 @@
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import queries
+from model import Base, Action, Action_Tag, Group, Tag, Note
+
+# Сравнение CPU на "запрос" (action + группа + тег + заметки + дети):
+# старые цепочки self.db.query(...).filter(...) против queries.* (lambda_stmt).
+# Использует sqlite в памяти, settings.yml не нужен.
+ROUNDS = 2000
+
+
+def seed(db):
+    group = Group(name='SOON')
+    tag = Tag(name='work', color='#b0c4de')
+    db.add_all([group, tag])
+    db.flush()
+    parent = Action(action='My first Action', group_id=group.id)
+    db.add(parent)
+    db.flush()
+    child = Action(action='sub Action 1', parent_id=parent.id, group_id=group.id)
+    db.add(child)
+    db.flush()
+    db.add_all([
+        Action_Tag(action_id=parent.id, tag_id=tag.id),
+        Note(action_id=parent.id, type='text', payload='hello'),
+    ])
+    db.commit()
+    return parent.id, group.id
+
+
+def legacy_request(db, action_id, group_id):
+    db.query(Action).filter(Action.id == action_id).first()
+    db.query(Group).filter(Group.id == group_id).first()
+    action_tag = db.query(Action_Tag).filter(Action_Tag.action_id == action_id).first()
+    db.query(Tag).filter(Tag.id == action_tag.tag_id).first()
+    db.query(Note).filter(Note.action_id == action_id).all()
+    db.query(Action).filter(Action.parent_id == action_id).all()
+
+
+def cached_request(db, action_id, group_id):
+    db.execute(queries.action_by_id(action_id)).scalars().first()
+    db.execute(queries.group_by_id(group_id)).scalars().first()
+    action_tag = db.execute(queries.action_tag_by_action(action_id)).scalars().first()
+    db.execute(queries.tag_by_id(action_tag.tag_id)).scalars().first()
+    db.execute(queries.notes_by_action(action_id)).scalars().all()
+    db.execute(queries.actions_by_parent(action_id)).scalars().all()
+
+
+def run(name, request, db, stats, action_id, group_id):
+    request(db, action_id, group_id)
+    stats.reset()
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        request(db, action_id, group_id)
+        db.expire_all()
+    elapsed = time.process_time() - start
+    per_request = elapsed / ROUNDS * 1e6
+    print(f'{name:>8}: {per_request:8.1f} us CPU/request, cache {stats.as_dict()}')
+    return per_request
+
+
+if __name__ == '__main__':
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    stats = queries.track_cache(engine)
+    db = sessionmaker(bind=engine)()
+    action_id, group_id = seed(db)
+
+    legacy = run('legacy', legacy_request, db, stats, action_id, group_id)
+    cached = run('cached', cached_request, db, stats, action_id, group_id)
+    print(f'   saved: {legacy - cached:8.1f} us CPU/request ({(legacy - cached) / legacy:.0%})')
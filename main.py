@@ -9,7 +9,7 @@ from starlette.exceptions import HTTPException
 
 from model import PydanticAction, PydanticNote, PydanticGroup
 from repo import ActionAlchemyRepository, NoteAlchemyRepository, GroupAlchemyRepository, \
-    get_action_repo, get_note_repo, get_group_repo
+    get_action_repo, get_note_repo, get_group_repo, cache_stats
 from utils.auth import get_api_key
 
 app = FastAPI(swagger_ui_parameters={"tryItOutEnabled":True})
@@ -189,5 +189,19 @@ def group_delete(_id: int, api_key : APIKey = Depends(get_api_key),
     return raiser(repo.group_delete(_id))
 
 
+@app.get('/stats/cache', tags=['STATS'])
+def compiled_cache_stats(api_key: APIKey = Depends(get_api_key)):
+    """Попадания в compiled cache SQLAlchemy с момента старта.
+        Ответ:
+            {
+              "hits": 1520,
+              "misses": 11,
+              "uncached": 0,
+              "hit_rate": 0.9928
+            }
+        """
+    return cache_stats.as_dict()
+
+
 if __name__ == '__main__':
     uvicorn.run("__main__:app", host="127.0.0.1", port=8220, reload=True)
@@ -0,0 +1,95 @@
+from sqlalchemy import delete, event, lambda_stmt, select
+
+from model import Action, Action_Tag, Group, Tag, Note
+
+
+# Горячие запросы репозиториев. lambda_stmt строит select() один раз, дальше
+# замыкания уходят в bound-параметры, а SQL берётся из compiled cache движка.
+def action_by_id(_id):
+    return lambda_stmt(lambda: select(Action).where(Action.id == _id))
+
+
+def actions_by_parent(_id):
+    return lambda_stmt(lambda: select(Action).where(Action.parent_id == _id))
+
+
+def actions_by_group(_id):
+    return lambda_stmt(lambda: select(Action).where(Action.group_id == _id))
+
+
+def actions_by_name(name):
+    pattern = f'%{name}%'
+    return lambda_stmt(lambda: select(Action).where(Action.action.like(pattern)).limit(20))
+
+
+def action_tag_by_action(_id):
+    return lambda_stmt(lambda: select(Action_Tag).where(Action_Tag.action_id == _id))
+
+
+def tag_by_id(_id):
+    return lambda_stmt(lambda: select(Tag).where(Tag.id == _id))
+
+
+def group_by_id(_id):
+    return lambda_stmt(lambda: select(Group).where(Group.id == _id))
+
+
+def note_by_id(_id):
+    return lambda_stmt(lambda: select(Note).where(Note.id == _id))
+
+
+def notes_by_action(_id):
+    return lambda_stmt(lambda: select(Note).where(Note.action_id == _id))
+
+
+def note_delete_by_id(_id):
+    return lambda_stmt(lambda: delete(Note).where(Note.id == _id))
+
+
+def group_delete_by_id(_id):
+    return lambda_stmt(lambda: delete(Group).where(Group.id == _id))
+
+
+class CacheStats(object):
+    """Счётчики попаданий в compiled cache движка"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        if total == 0:
+            return
+        return self.hits / total
+
+    def as_dict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'uncached': self.uncached,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+
+def track_cache(engine) -> CacheStats:
+    stats = CacheStats()
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if context is None:
+            return
+        if context.cache_hit == context.dialect.CACHE_HIT:
+            stats.hits += 1
+        elif context.cache_hit == context.dialect.CACHE_MISS:
+            stats.misses += 1
+        else:
+            stats.uncached += 1
+
+    return stats
@@ -4,7 +4,8 @@ from sqlalchemy import create_engine, desc
 from sqlalchemy.orm import sessionmaker
 
 
-from model import PydanticAction, PydanticNote, PydanticGroup, Action, Action_Tag, Group, Tag, Note
+import queries
+from model import PydanticAction, PydanticNote, PydanticGroup, Action, Group, Note
 
 with open('settings.yml') as config_file:
     config = yaml.load(config_file, Loader=yaml.FullLoader)
@@ -12,6 +13,7 @@ with open('settings.yml') as config_file:
 engine = create_engine(f"postgresql+psycopg2://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}",
                        echo=True)
 SessionLocal = sessionmaker(bind=engine)
+cache_stats = queries.track_cache(engine)
 
 
 class ActionAlchemyRepository(object):
@@ -41,7 +43,7 @@ class ActionAlchemyRepository(object):
         return item
 
     def update(self, item: Action, item_id):
-        tbc = self.db.query(Action).filter(Action.id == item_id).first()
+        tbc = self.db.execute(queries.action_by_id(item_id)).scalars().first()
         tbc.action = item.action
         tbc.parent_id = item.parent_id
         tbc.group_id = item.group_id
@@ -66,12 +68,7 @@ class ActionAlchemyRepository(object):
 
     def note_match(self, _id):
         try:
-            output = (self.db.query(Note)
-                      .filter(
-                            Note.action_id == _id
-                            )
-                      .all()
-                      )
+            output = self.db.execute(queries.notes_by_action(_id)).scalars().all()
             try:
                 note = output[0]
             except:
@@ -81,26 +78,12 @@ class ActionAlchemyRepository(object):
         return note
 
     def group_match(self, _id):
-        return (self.db.query(Group)
-                .filter(
-                   Group.id == _id
-                   )
-                .first()
-                ).name
+        return self.db.execute(queries.group_by_id(_id)).scalars().first().name
 
     def tag_match(self, _id):
         try:
-            action_tag = (self.db.query(Action_Tag)
-                          .filter(
-                                Action_Tag.action_id == _id
-                                )
-                          .first()
-                          )
-            actual_tag = (self.db.query(Tag)
-                          .filter(
-                                Tag.id == action_tag.tag_id
-                                )
-                          )
+            action_tag = self.db.execute(queries.action_tag_by_action(_id)).scalars().first()
+            actual_tag = self.db.execute(queries.tag_by_id(action_tag.tag_id)).scalars().first()
             full_tag = {
                 "name": actual_tag.name,
                 "color": actual_tag.color
@@ -111,12 +94,7 @@ class ActionAlchemyRepository(object):
 
     def child_match(self, _id):
         try:
-            output = (self.db.query(Action)
-                     .filter(
-                         Action.parent_id == _id
-                         )
-                     .all()
-                     )
+            output = self.db.execute(queries.actions_by_parent(_id)).scalars().all()
             for i in range(output.__len__()):
                 if output[i].group_id is None:
                     output[i].group = None
@@ -135,12 +113,7 @@ class ActionAlchemyRepository(object):
         return output
 
     def fetch_by_action_id(self, _id):
-        main_action = (self.db.query(Action)
-                       .filter(
-                            Action.id == _id
-                            )
-                       .first()
-                       )
+        main_action = self.db.execute(queries.action_by_id(_id)).scalars().first()
         if main_action is None:
             return
 
@@ -162,10 +135,7 @@ class ActionAlchemyRepository(object):
 
     def dogshit(self, _id):
         try:
-            main_action = (self.db.query(Action)
-                           .filter(Action.parent_id == _id)
-                           .all()
-                           )
+            main_action = self.db.execute(queries.actions_by_parent(_id)).scalars().all()
             for i in main_action:
                 i.tag = self.tag_match(i.id)
                 if i.group_id is None:
@@ -178,13 +148,7 @@ class ActionAlchemyRepository(object):
         return main_action
 
     def fetch_by_action_name(self, name):
-        main_action = (self.db.query(Action)
-                       .filter(
-                            Action.action.like(f'%{name}%')
-                            )
-                       .limit(20)
-                       .all()
-                       )
+        main_action = self.db.execute(queries.actions_by_name(name)).scalars().all()
         for i in main_action:
             i.children = self.dogshit(i.id)
             if i.group_id is None:
@@ -235,7 +199,7 @@ class NoteAlchemyRepository(object):
         return item
 
     def update(self, item: Note, item_id):
-        tbc = self.db.query(Note).filter(Note.id == item_id).first()
+        tbc = self.db.execute(queries.note_by_id(item_id)).scalars().first()
         tbc.action_id = item.action_id
         tbc.type = item.type
         tbc.payload = item.payload
@@ -259,10 +223,7 @@ class NoteAlchemyRepository(object):
 
     def note_fetch_by_id(self, _id):
         try:
-            note = (self.db.query(Note)
-                    .filter(Note.id == _id)
-                    .first()
-                    )
+            note = self.db.execute(queries.note_by_id(_id)).scalars().first()
             if note is None:
                 raise AttributeError
         except AttributeError:
@@ -270,10 +231,7 @@ class NoteAlchemyRepository(object):
         return note
 
     def note_delete(self, _id):
-        note = (self.db.query(Note)
-                .filter(Note.id == _id)
-                .delete()
-                )
+        note = self.db.execute(queries.note_delete_by_id(_id)).rowcount
         self.db.commit()
         if note == 1:
             return {'detail': 'deleted'}
@@ -304,7 +262,7 @@ class GroupAlchemyRepository(object):
         return item
 
     def update(self, item: Group, item_id):
-        tbc = self.db.query(Group).filter(Group.id == item_id).first()
+        tbc = self.db.execute(queries.group_by_id(item_id)).scalars().first()
         tbc.name = item.name
         self.db.commit()
         return item
@@ -331,17 +289,11 @@ class GroupAlchemyRepository(object):
         return groups
 
     def group_delete(self, _id):
-        action = (self.db.query(Action)
-                  .filter(Action.group_id == _id)
-                  .all()
-                  )
+        action = self.db.execute(queries.actions_by_group(_id)).scalars().all()
         for i in action:
             i.group_id = None
         self.db.commit()
-        group = (self.db.query(Group)
-                 .filter(Group.id == _id)
-                 .delete()
-                 )
+        group = self.db.execute(queries.group_delete_by_id(_id)).rowcount
         self.db.commit()
         if group == 1:
             return {'detail': 'deleted'}